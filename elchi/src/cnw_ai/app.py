@@ -6,7 +6,7 @@ import time
 import streamlit as st
 
 from cnw_ai.config import COLLECTION_NAME, LLM_MODEL, QDRANT_URL
-from cnw_ai.rag import get_chain, get_qdrant_client, get_retriever
+from cnw_ai.rag import generate, get_answer_chain, get_qdrant_client, get_retriever, retrieve
 
 st.set_page_config(page_title="Elchi AI Assistant", page_icon="🛡️", layout="wide")
 
@@ -27,7 +27,7 @@ with st.sidebar:
             result = qclient.scroll(
                 collection_name=COLLECTION_NAME,
                 limit=1,
-                with_payload=["domain", "source_id"],
+                with_payload=["metadata.domain", "metadata.source_id"],
                 with_vectors=False,
             )
             if result[0]:
@@ -46,9 +46,9 @@ with st.sidebar:
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
-if "chain" not in st.session_state:
+if "answer_chain" not in st.session_state:
     try:
-        st.session_state.chain = get_chain()
+        st.session_state.answer_chain = get_answer_chain()
         st.session_state.retriever = get_retriever()
     except Exception as e:
         st.error(f"Failed to initialize RAG chain: {e}")
@@ -69,13 +69,14 @@ if prompt := st.chat_input("Ask a question about Elchi/Envoy..."):
         # Retrieval
         with st.spinner("Retrieving..."):
             t0 = time.perf_counter()
-            sources = st.session_state.retriever.invoke(prompt)
+            sources = retrieve(prompt, st.session_state.retriever)
             t_retrieval = time.perf_counter() - t0
 
         # LLM generation
         with st.spinner("Generating..."):
             t0 = time.perf_counter()
-            answer = st.session_state.chain.invoke(prompt)
+            # Reuse the retrieved docs; the full chain would query Qdrant again
+            answer = generate(prompt, sources, st.session_state.answer_chain)
             t_llm = time.perf_counter() - t0
 
         # Strip <think>...</think> blocks from deepseek-r1
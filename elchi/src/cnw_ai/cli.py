@@ -5,12 +5,14 @@ from __future__ import annotations
 import argparse
 import sys
 
+from typing import TYPE_CHECKING
+
 from cnw_ai.config import DEFAULT_SOURCES_YAML
-from cnw_ai.pipeline.config_loader import filter_sources, load_sources
-from cnw_ai.pipeline.models import PipelineResult
-from cnw_ai.pipeline.runner import PipelineRunner
 from cnw_ai.utils.logging import setup_logging, get_logger
 
+if TYPE_CHECKING:
+    from cnw_ai.pipeline.models import PipelineResult
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -48,6 +50,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=0,
         help="Max files per source (0 = unlimited, useful for testing)",
     )
+    parser.add_argument(
+        "--no-parallel",
+        dest="parallel",
+        action="store_false",
+        help="Parse files in-process instead of in a worker process pool",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -63,6 +71,10 @@ def main(argv: list[str] | None = None) -> None:
     setup_logging(verbose=args.verbose)
     log = get_logger("cli")
 
+    # Imported here so --help and argument errors don't load yaml/qdrant/httpx
+    from cnw_ai.pipeline.config_loader import filter_sources, load_sources
+    from cnw_ai.pipeline.runner import PipelineRunner
+
     log.info("loading_config", path=args.config)
     sources = load_sources(args.config)
 
@@ -83,6 +95,8 @@ def main(argv: list[str] | None = None) -> None:
         dry_run=args.dry_run,
         reindex=args.reindex,
         max_items=args.max_items,
+        parallel=args.parallel,
+        verbose=args.verbose,
     )
     result: PipelineResult = runner.run()
 
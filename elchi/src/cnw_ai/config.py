@@ -23,11 +23,18 @@ CHUNK_SIZE = 4000  # chars (~1000 tokens)
 CHUNK_OVERLAP = 600  # chars (~150 tokens)
 MIN_CHUNK_LENGTH = 200  # skip chunks shorter than this
 
+# Ingest: files parsed and pushed through chunk → embed → upsert at a time
+INGEST_BATCH_SIZE = 64
+# Batches with at least this many files are parsed in a process pool
+PARALLEL_PARSE_MIN_FILES = 32
+
 # Embedding
 EMBED_BATCH_SIZE = 64
 
 # Upsert
 UPSERT_BATCH_SIZE = 100
+# Embedded batches allowed to queue up behind the background upsert thread
+UPSERT_MAX_PENDING = 4
 
 # Retrieval
 TOP_K = 8
@@ -1,6 +1,32 @@
 """Elchi AI ingest pipeline."""
 
-from cnw_ai.pipeline.runner import PipelineRunner
-from cnw_ai.pipeline.config_loader import load_sources
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cnw_ai.pipeline.config_loader import load_sources
+    from cnw_ai.pipeline.runner import PipelineRunner
 
 __all__ = ["PipelineRunner", "load_sources"]
+
+# Resolved on first access (PEP 562): importing any cnw_ai.pipeline submodule
+# runs this file, and the runner pulls in qdrant_client (~0.6s).
+_LAZY = {
+    "PipelineRunner": "cnw_ai.pipeline.runner",
+    "load_sources": "cnw_ai.pipeline.config_loader",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import json
+import os
+import sys
+from dataclasses import asdict
 from pathlib import Path
+from typing import Iterable, Iterator
 
 import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.resolver import Resolver
 
 from cnw_ai.pipeline.models import SourceConfig
 from cnw_ai.utils.logging import get_logger
@@ -14,6 +22,30 @@ log = get_logger(__name__)
 REQUIRED_FIELDS = {"id", "domain", "priority", "source_type", "location"}
 VALID_SOURCE_TYPES = {"git", "web", "local", "jsonl"}
 
+try:
+    from yaml.cyaml import CParser
+except ImportError:  # PyYAML built without libyaml
+    _EventLoader = yaml.SafeLoader
+else:
+
+    class _EventLoader(CParser, Composer, SafeConstructor, Resolver):
+        """libyaml event parser with the pure-Python composer and safe constructor.
+
+        ``yaml.CSafeLoader`` only composes whole documents, so it can't be used
+        to stream the sources list one entry at a time.
+        """
+
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+
+def _intern(value):
+    """Intern YAML string values; leave non-strings (e.g. numeric versions) as is."""
+    return sys.intern(value) if isinstance(value, str) else value
+
 
 def load_sources(config_path: str | Path) -> list[SourceConfig]:
     """Load and validate source configs from YAML file."""
@@ -21,15 +53,90 @@ def load_sources(config_path: str | Path) -> list[SourceConfig]:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
+    st = config_path.stat()
+    key = [st.st_mtime_ns, st.st_size]
+    cache_path = config_path.with_name(config_path.name + ".cache.json")
+
+    entries = _read_cache(cache_path, key)
+    if entries is not None:
+        sources = _build_sources(entries)
+        log.info("sources_loaded", count=len(sources), cached=True)
+        return sources
+
     with open(config_path, encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+        sources = _build_sources(_iter_source_entries(f, config_path))
 
-    if not raw or "sources" not in raw:
+    _write_cache(cache_path, key, sources)
+    log.info("sources_loaded", count=len(sources))
+    return sources
+
+
+def _read_cache(cache_path: Path, key: list[int]) -> list[dict] | None:
+    """Return cached source entries if the cache matches the YAML file's stat key."""
+    try:
+        cached = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return cached.get("sources")
+
+
+def _write_cache(cache_path: Path, key: list[int], sources: list[SourceConfig]) -> None:
+    """Best-effort write of the parsed sources next to the YAML file."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        # No default=str: values JSON can't hold (e.g. YAML dates) would come
+        # back from the cache with a different type, so such configs aren't cached.
+        payload = json.dumps(
+            {"key": key, "sources": [asdict(s) for s in sources]}, separators=(",", ":")
+        )
+        tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except (TypeError, ValueError, OSError) as e:
+        log.debug("sources_cache_write_failed", path=str(cache_path), error=str(e))
+        tmp_path.unlink(missing_ok=True)
+
+
+def _iter_source_entries(stream, config_path: Path) -> Iterator[dict]:
+    """Yield the entries of the top-level 'sources' list one at a time.
+
+    Walks the YAML event stream and only composes/constructs one source
+    mapping at a time, so the full document tree is never built.
+    """
+    loader = _EventLoader(stream)
+    found = False
+    try:
+        loader.get_event()  # StreamStart
+        if loader.check_event(yaml.DocumentStartEvent):
+            loader.get_event()
+            if loader.check_event(yaml.MappingStartEvent):
+                loader.get_event()
+                while not loader.check_event(yaml.MappingEndEvent):
+                    key = loader.construct_document(loader.compose_node(None, None))
+                    if key != "sources" or not loader.check_event(yaml.SequenceStartEvent):
+                        loader.compose_node(None, None)  # skip value
+                        continue
+
+                    found = True
+                    loader.get_event()
+                    index = 0
+                    while not loader.check_event(yaml.SequenceEndEvent):
+                        yield loader.construct_document(loader.compose_node(None, index))
+                        index += 1
+                    loader.get_event()
+    finally:
+        loader.dispose()
+
+    if not found:
         raise ValueError(f"Config file must contain 'sources' key: {config_path}")
 
+
+def _build_sources(entries: Iterable[dict]) -> list[SourceConfig]:
+    """Validate raw source entries and convert them to SourceConfig."""
     sources = []
-    for i, entry in enumerate(raw["sources"]):
-        missing = REQUIRED_FIELDS - set(entry.keys())
+    for i, entry in enumerate(entries):
+        missing = REQUIRED_FIELDS - entry.keys()
         if missing:
             raise ValueError(f"Source #{i} missing required fields: {missing}")
 
@@ -39,25 +146,25 @@ def load_sources(config_path: str | Path) -> list[SourceConfig]:
                 f"Valid types: {VALID_SOURCE_TYPES}"
             )
 
+        # Interned: referenced by every ParsedDocument/ChunkDoc of this source
         source = SourceConfig(
-            id=entry["id"],
-            domain=entry["domain"],
+            id=_intern(entry["id"]),
+            domain=_intern(entry["domain"]),
             priority=entry["priority"],
-            source_type=entry["source_type"],
+            source_type=_intern(entry["source_type"]),
             location=entry["location"],
             branch=entry.get("branch", "main"),
             include_globs=entry.get("include_globs", []),
             exclude_globs=entry.get("exclude_globs", []),
             parser_hint=entry.get("parser_hint", "auto"),
-            tags=entry.get("tags", []),
-            component=entry.get("component", ""),
-            version=entry.get("version", ""),
-            license=entry.get("license", ""),
+            tags=[_intern(t) for t in entry.get("tags", [])],
+            component=_intern(entry.get("component", "")),
+            version=_intern(entry.get("version", "")),
+            license=_intern(entry.get("license", "")),
         )
         sources.append(source)
         log.debug("loaded_source", source_id=source.id, source_type=source.source_type)
 
-    log.info("sources_loaded", count=len(sources))
     return sources
 
 
@@ -70,7 +177,9 @@ def filter_sources(
     """Filter sources by domain and/or source_id."""
     filtered = sources
     if domains:
-        filtered = [s for s in filtered if s.domain in domains]
+        domain_set = frozenset(domains)
+        filtered = [s for s in filtered if s.domain in domain_set]
     if source_ids:
-        filtered = [s for s in filtered if s.id in source_ids]
+        id_set = frozenset(source_ids)
+        filtered = [s for s in filtered if s.id in id_set]
     return filtered
@@ -5,37 +5,55 @@ Uses qdrant-client and httpx directly - no langchain dependency.
 
 from __future__ import annotations
 
-import httpx
+from functools import cache
+from typing import Iterator
 
 from cnw_ai.config import EMBED_BATCH_SIZE, EMBEDDING_MODEL, OLLAMA_BASE_URL
 from cnw_ai.pipeline.models import ChunkDoc
 from cnw_ai.utils.logging import get_logger
 
+try:
+    # ~6x faster than json on the float-heavy /api/embed responses
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    from json import dumps as _json_dumps, loads as _json_loads
+
 log = get_logger(__name__)
 
 
+@cache
+def _get_http_client(base_url: str):
+    """Return a keep-alive HTTP client for the given Ollama server."""
+    import httpx
+
+    return httpx.Client(
+        base_url=base_url,
+        timeout=120,
+        limits=httpx.Limits(keepalive_expiry=60),
+    )
+
+
 def _embed_batch_ollama(texts: list[str], model: str, base_url: str) -> list[list[float]]:
     """Embed a batch of texts using Ollama API."""
     # Ollama supports batch embedding via /api/embed
-    resp = httpx.post(
-        f"{base_url}/api/embed",
-        json={"model": model, "input": texts},
-        timeout=120,
+    resp = _get_http_client(base_url).post(
+        "/api/embed",
+        content=_json_dumps({"model": model, "input": texts}),
+        headers={"Content-Type": "application/json"},
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = _json_loads(resp.content)
     return data["embeddings"]
 
 
-def embed_chunks(
+def embed_batches(
     chunks: list[ChunkDoc],
     *,
     model: str = EMBEDDING_MODEL,
     base_url: str = OLLAMA_BASE_URL,
     batch_size: int = EMBED_BATCH_SIZE,
-) -> list[list[float]]:
-    """Embed all chunks and return vectors in the same order."""
-    all_vectors: list[list[float]] = []
+) -> Iterator[tuple[list[ChunkDoc], list[list[float]]]]:
+    """Embed chunks batch by batch, yielding each batch with its vectors."""
     total = len(chunks)
 
     for i in range(0, total, batch_size):
@@ -43,7 +61,21 @@ def embed_chunks(
         texts = [f"search_document: {c.text}" for c in batch]
 
         log.debug("embedding_batch", batch=f"{i}-{i + len(batch)}/{total}")
-        vectors = _embed_batch_ollama(texts, model, base_url)
+        yield batch, _embed_batch_ollama(texts, model, base_url)
+
+
+def embed_chunks(
+    chunks: list[ChunkDoc],
+    *,
+    model: str = EMBEDDING_MODEL,
+    base_url: str = OLLAMA_BASE_URL,
+    batch_size: int = EMBED_BATCH_SIZE,
+) -> list[list[float]]:
+    """Embed all chunks and return vectors in the same order."""
+    all_vectors: list[list[float]] = []
+    for _, vectors in embed_batches(
+        chunks, model=model, base_url=base_url, batch_size=batch_size
+    ):
         all_vectors.extend(vectors)
 
     log.info("embedded", count=len(all_vectors), dim=len(all_vectors[0]) if all_vectors else 0)
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import fnmatch
+import os
+import re
+from email.utils import formatdate
+from functools import lru_cache
 from pathlib import Path
 
-import git as gitpython
-
 from cnw_ai.config import WORKDIR
 from cnw_ai.pipeline.models import SourceConfig
 from cnw_ai.utils.logging import get_logger
@@ -14,10 +16,15 @@ from cnw_ai.utils.logging import get_logger
 log = get_logger(__name__)
 
 
-def _match_globs(path: Path, root: Path, globs: list[str]) -> bool:
-    """Check if a path matches any of the glob patterns."""
-    rel = str(path.relative_to(root))
-    return any(fnmatch.fnmatch(rel, g) for g in globs)
+@lru_cache(maxsize=128)
+def _compile_globs(globs: tuple[str, ...]) -> re.Pattern:
+    """Compile glob patterns into one regex (same semantics as fnmatch.fnmatch)."""
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(g)) for g in globs))
+
+
+def _match_globs(path: Path, root: Path, globs_re: re.Pattern) -> bool:
+    """Check if a path matches any of the glob patterns (see _compile_globs)."""
+    return globs_re.match(os.path.normcase(str(path.relative_to(root)))) is not None
 
 
 def _collect_files(
@@ -30,11 +37,13 @@ def _collect_files(
         # Default: all files
         include_globs = ["**/*"]
 
+    exclude_re = _compile_globs(tuple(exclude_globs)) if exclude_globs else None
+
     for pattern in include_globs:
         for path in root.glob(pattern):
             if not path.is_file():
                 continue
-            if exclude_globs and _match_globs(path, root, exclude_globs):
+            if exclude_re and _match_globs(path, root, exclude_re):
                 continue
             files.append(path)
 
@@ -47,9 +56,18 @@ def _collect_files(
     return files
 
 
+def source_root(source: SourceConfig) -> Path:
+    """Directory that a source's fetched files live under."""
+    if source.source_type in ("git", "web"):
+        return WORKDIR / source.id
+    return Path(source.location)
+
+
 def fetch_git(source: SourceConfig, max_items: int = 0) -> list[Path]:
     """Clone or pull a git repository, then collect matching files."""
-    workdir = WORKDIR / source.id
+    import git as gitpython
+
+    workdir = source_root(source)
     workdir.parent.mkdir(parents=True, exist_ok=True)
 
     if workdir.exists() and (workdir / ".git").exists():
@@ -75,46 +93,71 @@ def fetch_git(source: SourceConfig, max_items: int = 0) -> list[Path]:
     return _collect_files(workdir, source.include_globs, source.exclude_globs, max_items)
 
 
+def _conditional_headers(dest: Path, etag_path: Path) -> dict[str, str]:
+    """Build revalidation headers for a cached download."""
+    headers = {"If-Modified-Since": formatdate(dest.stat().st_mtime, usegmt=True)}
+    if etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
+    return headers
+
+
 def fetch_web(source: SourceConfig, max_items: int = 0) -> list[Path]:
-    """Download web pages with httpx, cache in workdir."""
+    """Download web pages with httpx, cache in workdir.
+
+    Cached pages are revalidated with a conditional GET (stored ETag and
+    file mtime), so unchanged pages cost a 304 instead of a full download.
+    """
     import httpx
 
-    workdir = WORKDIR / source.id
+    workdir = source_root(source)
     workdir.mkdir(parents=True, exist_ok=True)
 
     urls = [source.location]
     downloaded: list[Path] = []
 
-    for url in urls:
-        # Simple filename from URL
-        safe_name = url.split("//")[-1].replace("/", "_").replace("?", "_")[:200]
-        if not safe_name.endswith(".html"):
-            safe_name += ".html"
-        dest = workdir / safe_name
-
-        if dest.exists():
-            log.debug("web_cached", url=url, path=str(dest))
-            downloaded.append(dest)
-            continue
-
-        log.info("web_download", url=url)
-        try:
-            resp = httpx.get(url, follow_redirects=True, timeout=30)
-            resp.raise_for_status()
-            dest.write_text(resp.text, encoding="utf-8")
-            downloaded.append(dest)
-        except Exception as e:
-            log.warning("web_download_failed", url=url, error=str(e))
-
-        if max_items > 0 and len(downloaded) >= max_items:
-            break
+    with httpx.Client(follow_redirects=True, timeout=30) as client:
+        for url in urls:
+            # Simple filename from URL
+            safe_name = url.split("//")[-1].replace("/", "_").replace("?", "_")[:200]
+            if not safe_name.endswith(".html"):
+                safe_name += ".html"
+            dest = workdir / safe_name
+            etag_path = dest.with_name(dest.name + ".etag")
+            cached = dest.exists()
+
+            log.info("web_download", url=url, revalidate=cached)
+            try:
+                headers = _conditional_headers(dest, etag_path) if cached else {}
+                resp = client.get(url, headers=headers)
+                if cached and resp.status_code == 304:
+                    log.debug("web_cached", url=url, path=str(dest))
+                    dest.touch()
+                else:
+                    resp.raise_for_status()
+                    dest.write_text(resp.text, encoding="utf-8")
+                    etag = resp.headers.get("etag")
+                    if etag:
+                        etag_path.write_text(etag, encoding="utf-8")
+                    else:
+                        etag_path.unlink(missing_ok=True)
+                downloaded.append(dest)
+            except Exception as e:
+                if cached:
+                    # Serve the stale copy rather than dropping the source
+                    log.warning("web_revalidate_failed", url=url, error=str(e))
+                    downloaded.append(dest)
+                else:
+                    log.warning("web_download_failed", url=url, error=str(e))
+
+            if max_items > 0 and len(downloaded) >= max_items:
+                break
 
     return downloaded
 
 
 def fetch_local(source: SourceConfig, max_items: int = 0) -> list[Path]:
     """Collect files from a local directory."""
-    root = Path(source.location)
+    root = source_root(source)
     if not root.exists():
         log.warning("local_not_found", source_id=source.id, path=str(root))
         return []
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceConfig:
     """A single source definition from sources.yaml."""
 
@@ -25,7 +25,7 @@ class SourceConfig:
     license: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedDocument:
     """A single parsed unit (section, Q&A pair, proto block, etc.)."""
 
@@ -38,7 +38,7 @@ class ParsedDocument:
     source_type: str
     priority: int
     version: str = ""
-    tags: list[str] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)  # may be shared; copy before mutating
     component: str = ""
     license: str = ""
     origin: str = ""
@@ -50,7 +50,7 @@ class ParsedDocument:
     oneof: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkDoc:
     """A chunk ready for embedding and upserting."""
 
@@ -82,7 +82,7 @@ class ChunkDoc:
         """Convert to Qdrant payload dict.
 
         langchain-qdrant expects: {"text": ..., "metadata": {...}}
-        Top-level keys also kept for Qdrant payload filtering.
+        Filterable fields are indexed in place as "metadata.<field>".
         """
         meta = {
             "source_id": self.source_id,
@@ -116,20 +116,7 @@ class ChunkDoc:
 
         # text at top level for content_payload_key="text"
         # metadata nested for metadata_payload_key="metadata"
-        # flat copies of filterable fields for Qdrant payload indexes
-        payload = {
-            "text": self.text,
-            "metadata": meta,
-            # Flat copies for Qdrant index/filter
-            "source_id": self.source_id,
-            "domain": self.domain,
-            "source_type": self.source_type,
-            "priority": self.priority,
-            "component": self.component,
-            "tags": self.tags,
-            "text_hash": self.text_hash,
-        }
-        return payload
+        return {"text": self.text, "metadata": meta}
 
 
 @dataclass
@@ -146,17 +133,16 @@ class PipelineResult:
     errors: list[str] = field(default_factory=list)
 
     def summary(self) -> str:
-        lines = [
-            f"Sources processed: {self.sources_processed}",
-            f"Files fetched:     {self.files_fetched}",
-            f"Documents parsed:  {self.documents_parsed}",
-            f"Chunks created:    {self.chunks_created}",
-            f"Chunks embedded:   {self.chunks_embedded}",
-            f"Chunks upserted:   {self.chunks_upserted}",
-            f"Chunks deduped:    {self.chunks_skipped_dedup}",
-        ]
+        text = (
+            f"Sources processed: {self.sources_processed}\n"
+            f"Files fetched:     {self.files_fetched}\n"
+            f"Documents parsed:  {self.documents_parsed}\n"
+            f"Chunks created:    {self.chunks_created}\n"
+            f"Chunks embedded:   {self.chunks_embedded}\n"
+            f"Chunks upserted:   {self.chunks_upserted}\n"
+            f"Chunks deduped:    {self.chunks_skipped_dedup}"
+        )
         if self.errors:
-            lines.append(f"Errors:            {len(self.errors)}")
-            for err in self.errors[:10]:
-                lines.append(f"  - {err}")
-        return "\n".join(lines)
+            text += f"\nErrors:            {len(self.errors)}"
+            text += "".join(f"\n  - {err}" for err in self.errors[:10])
+        return text
@@ -2,56 +2,68 @@
 
 from __future__ import annotations
 
+import importlib
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Callable
 
 from cnw_ai.pipeline.models import ParsedDocument, SourceConfig
-from cnw_ai.pipeline.parsers.markdown import parse_markdown
-from cnw_ai.pipeline.parsers.html import parse_html
-from cnw_ai.pipeline.parsers.proto import parse_proto
-from cnw_ai.pipeline.parsers.code import parse_code
-from cnw_ai.pipeline.parsers.jsonl import parse_jsonl
-from cnw_ai.pipeline.parsers.pdf import parse_pdf
 from cnw_ai.utils.logging import get_logger
 
 log = get_logger(__name__)
 
+# Parser functions as (module, function) pairs, imported on first use so that
+# e.g. bs4/markdownify are only loaded when an HTML file is actually parsed.
+_MARKDOWN = ("cnw_ai.pipeline.parsers.markdown", "parse_markdown")
+_HTML = ("cnw_ai.pipeline.parsers.html", "parse_html")
+_PROTO = ("cnw_ai.pipeline.parsers.proto", "parse_proto")
+_CODE = ("cnw_ai.pipeline.parsers.code", "parse_code")
+_JSONL = ("cnw_ai.pipeline.parsers.jsonl", "parse_jsonl")
+_PDF = ("cnw_ai.pipeline.parsers.pdf", "parse_pdf")
+
 # Extension → parser mapping
-_PARSER_MAP = {
-    ".md": parse_markdown,
-    ".rst": parse_markdown,  # RST treated similarly to markdown
-    ".html": parse_html,
-    ".htm": parse_html,
-    ".proto": parse_proto,
-    ".jsonl": parse_jsonl,
-    ".pdf": parse_pdf,
+_PARSER_MAP = MappingProxyType({
+    ".md": _MARKDOWN,
+    ".rst": _MARKDOWN,  # RST treated similarly to markdown
+    ".html": _HTML,
+    ".htm": _HTML,
+    ".proto": _PROTO,
+    ".jsonl": _JSONL,
+    ".pdf": _PDF,
     # Code files
-    ".go": parse_code,
-    ".py": parse_code,
-    ".yaml": parse_code,
-    ".yml": parse_code,
-    ".toml": parse_code,
-    ".json": parse_code,
-    ".sh": parse_code,
-    ".bash": parse_code,
-}
+    ".go": _CODE,
+    ".py": _CODE,
+    ".yaml": _CODE,
+    ".yml": _CODE,
+    ".toml": _CODE,
+    ".json": _CODE,
+    ".sh": _CODE,
+    ".bash": _CODE,
+})
+
+# parser_hint → parser mapping (overrides extension lookup)
+_HINT_MAP = MappingProxyType({
+    "markdown": _MARKDOWN,
+    "html": _HTML,
+    "proto": _PROTO,
+    "code": _CODE,
+    "jsonl": _JSONL,
+    "pdf": _PDF,
+})
+
+
+@cache
+def _load_parser(module: str, name: str) -> Callable[[Path, SourceConfig], list[ParsedDocument]]:
+    """Import a parser module and return its parse function."""
+    return getattr(importlib.import_module(module), name)
 
 
 def get_parser(file_path: Path, hint: str = "auto"):
     """Get the appropriate parser function for a file."""
-    if hint != "auto":
-        mapping = {
-            "markdown": parse_markdown,
-            "html": parse_html,
-            "proto": parse_proto,
-            "code": parse_code,
-            "jsonl": parse_jsonl,
-            "pdf": parse_pdf,
-        }
-        if hint in mapping:
-            return mapping[hint]
-
-    suffix = file_path.suffix.lower()
-    return _PARSER_MAP.get(suffix)
+    target = _HINT_MAP.get(hint) if hint != "auto" else None
+    target = target or _PARSER_MAP.get(file_path.suffix.lower())
+    return _load_parser(*target) if target else None
 
 
 def parse_file(
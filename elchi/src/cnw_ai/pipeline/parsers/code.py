@@ -5,151 +5,236 @@ Skips test/vendor/generated files. Only ingests documentation-valuable content.
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
+from cnw_ai.pipeline.fetcher import source_root
 from cnw_ai.pipeline.models import ParsedDocument, SourceConfig
+from cnw_ai.utils.files import decode_text
 
-# Patterns to skip
-_SKIP_PATTERNS = [
-    "**/vendor/**",
-    "**/*_test.go",
-    "**/test_*.py",
-    "**/*_test.py",
-    "**/tests/**",
-    "**/*.generated.*",
-    "**/*.pb.go",
-    "**/*.pb.*.go",
-    "**/node_modules/**",
-    "**/__pycache__/**",
-]
+# Paths to skip: vendor/test/generated files, matched in a single regex scan
+_SKIP_RE = re.compile(
+    r"(?:^|/)(?:vendor|tests|node_modules|__pycache__)/"
+    r"|_test\.go$"
+    r"|(?:^|/)test_[^/]*\.py$"
+    r"|_test\.py$"
+    r"|\.generated\.[^/]*$"
+    r"|\.pb(?:\.[^/]*)?\.go$"
+)
 
 # Max file size to parse (skip huge generated/vendor files)
 _MAX_FILE_SIZE = 200_000  # 200KB
+# Config files are only kept whole below this many characters
+_MAX_CONFIG_CHARS = 10_000
+_CONFIG_SUFFIXES = {".yaml", ".yml", ".toml", ".json"}
 
 
 def _should_skip(file_path: Path) -> bool:
-    """Check if file should be skipped based on patterns."""
-    path_str = str(file_path)
-    for pattern in _SKIP_PATTERNS:
-        # Simple glob-like matching
-        if "vendor" in path_str and "**/vendor/**" == pattern:
-            return True
-        if path_str.endswith("_test.go") and "**/*_test.go" == pattern:
-            return True
-        if path_str.endswith(".pb.go") and "**/*.pb.go" == pattern:
-            return True
-        if "node_modules" in path_str:
-            return True
-        if "__pycache__" in path_str:
-            return True
-    return False
+    """Check if file should be skipped based on patterns.
+
+    Pass the path relative to the source root (see _relative_path), so that
+    e.g. a checkout living under some "tests/" directory is not skipped.
+    """
+    return _SKIP_RE.search(file_path.as_posix()) is not None
+
+
+def _relative_path(file_path: Path, source: SourceConfig) -> Path:
+    """Return file_path relative to the source's root, if it lies under it."""
+    try:
+        return file_path.relative_to(source_root(source))
+    except ValueError:
+        return file_path
 
 
 _GO_DECL_KEYWORDS = {"func", "type", "var", "const"}
 
+# A "//" comment plus any directly following comment lines
+_GO_COMMENT_BLOCK_RE = re.compile(r"//[^\n]*(?:\n[^\S\n]*//[^\n]*)*")
+# Any number of blank lines
+_BLANK_LINES_RE = re.compile(r"(?:[^\S\n]*\n)*")
+
+
+def _line_end(text: str, pos: int) -> int:
+    """Return the offset of the newline ending the line at pos (or len(text))."""
+    eol = text.find("\n", pos)
+    return len(text) if eol == -1 else eol
+
+
+def _starts_line(text: str, idx: int) -> bool:
+    """Check that only whitespace precedes idx on its line."""
+    line_start = text.rfind("\n", 0, idx) + 1
+    return line_start == idx or text[line_start:idx].isspace()
+
 
 def _extract_go_docs(text: str) -> list[tuple[str, str]]:
-    """Extract Go doc comments with their symbol names (line-based, no regex)."""
+    """Extract Go doc comments with their symbol names.
+
+    Forward scan from one "//" comment block to the next, so code bodies are
+    skipped inside the regex engine; only blocks directly followed by a
+    declaration are sliced and cleaned up.
+    """
     results = []
-    lines = text.split("\n")
-    comment_buf: list[str] = []
+    n = len(text)
+    pos = 0
 
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("//"):
-            comment_buf.append(stripped.lstrip("/").strip())
+    while (block := _GO_COMMENT_BLOCK_RE.search(text, pos)) is not None:
+        start = block.start()
+        if not _starts_line(text, start):
+            # Trailing comment after code: resume on the next line
+            pos = _line_end(text, start) + 1
             continue
 
-        # Check if this line is a Go declaration
-        if comment_buf and stripped:
-            first_word = stripped.split("(")[0].split(" ")[0]
-            if first_word in _GO_DECL_KEYWORDS:
-                # Extract symbol name
-                parts = stripped.split()
-                symbol = parts[1].split("(")[0].split("[")[0] if len(parts) > 1 else ""
-                if symbol:
-                    doc = "\n".join(comment_buf).strip()
-                    if len(doc) > 30:
-                        results.append((symbol, doc))
+        pos = block.end() + 1
+        if pos > n:
+            break
+
+        stripped = text[pos : _line_end(text, pos)].strip()
+        if not stripped:
+            continue
+        first_word = stripped.split("(")[0].split(" ")[0]
+        if first_word not in _GO_DECL_KEYWORDS:
+            continue
+        parts = stripped.split()
+        symbol = parts[1].split("(")[0].split("[")[0] if len(parts) > 1 else ""
+        if not symbol:
+            continue
 
-        comment_buf.clear()
+        line_start = text.rfind("\n", 0, start) + 1
+        doc = "\n".join(
+            line.strip().lstrip("/").strip()
+            for line in text[line_start : block.end()].split("\n")
+        ).strip()
+        if len(doc) > 30:
+            results.append((symbol, doc))
 
     return results
 
 
 def _extract_python_docs(text: str) -> list[tuple[str, str]]:
-    """Extract Python docstrings (line-based scan)."""
+    """Extract Python docstrings.
+
+    Forward scan that jumps between "def "/"class " occurrences with
+    str.find instead of walking every line.
+    """
     results = []
-    lines = text.split("\n")
-    i = 0
-    while i < len(lines):
-        stripped = lines[i].strip()
-        # Look for def/class
-        if stripped.startswith(("def ", "class ")):
-            keyword = "def" if stripped.startswith("def") else "class"
-            symbol = stripped[len(keyword):].strip().split("(")[0].split(":")[0].strip()
-            # Scan for docstring on next non-empty lines
-            j = i + 1
-            while j < len(lines) and not lines[j].strip():
-                j += 1
-            if j < len(lines) and '"""' in lines[j]:
-                doc_lines = []
-                line_j = lines[j].strip()
-                # Single-line docstring
-                if line_j.count('"""') >= 2:
-                    doc = line_j.strip('" ')
-                    if len(doc) > 30:
-                        results.append((symbol, doc))
-                    i = j + 1
-                    continue
-                # Multi-line docstring
-                doc_lines.append(line_j.replace('"""', "").strip())
-                j += 1
-                while j < len(lines):
-                    if '"""' in lines[j]:
-                        doc_lines.append(lines[j].strip().replace('"""', "").strip())
-                        break
-                    doc_lines.append(lines[j].strip())
-                    j += 1
-                doc = "\n".join(doc_lines).strip()
-                if len(doc) > 30:
-                    results.append((symbol, doc))
-                i = j + 1
-                continue
-        i += 1
+    n = len(text)
+    pos = 0
+    next_def = text.find("def ")
+    next_class = text.find("class ")
+
+    while next_def != -1 or next_class != -1:
+        if next_class == -1 or (next_def != -1 and next_def < next_class):
+            idx = next_def
+        else:
+            idx = next_class
+
+        eol = _line_end(text, idx)
+        if _starts_line(text, idx):
+            stripped = text[idx:eol].strip()
+            pos = _scan_python_docstring(text, stripped, eol, results)
+        else:
+            pos = eol + 1
+
+        if pos >= n:
+            break
+        if 0 <= next_def < pos:
+            next_def = text.find("def ", pos)
+        if 0 <= next_class < pos:
+            next_class = text.find("class ", pos)
+
     return results
 
 
+def _scan_python_docstring(
+    text: str, stripped: str, eol: int, results: list[tuple[str, str]]
+) -> int:
+    """Collect the docstring following a def/class line ending at eol.
+
+    Appends (symbol, doc) to results and returns the offset to resume at.
+    """
+    n = len(text)
+    if not stripped.startswith(("def ", "class ")):
+        return eol + 1
+    keyword = "def" if stripped.startswith("def") else "class"
+    symbol = stripped[len(keyword):].strip().split("(")[0].split(":")[0].strip()
+
+    # Docstring must open on the next non-empty line
+    if eol >= n:
+        return n
+    doc_start = _BLANK_LINES_RE.match(text, eol + 1).end()
+    doc_eol = _line_end(text, doc_start)
+    if text.find('"""', doc_start, doc_eol) == -1:
+        return eol + 1
+
+    line_j = text[doc_start:doc_eol].strip()
+    if line_j.count('"""') >= 2:
+        # Single-line docstring
+        doc = line_j.strip('" ')
+        if len(doc) > 30:
+            results.append((symbol, doc))
+        return doc_eol + 1
+
+    # Multi-line docstring: runs up to the next line containing """
+    doc_lines = [line_j.replace('"""', "").strip()]
+    body_end = doc_eol
+    if doc_eol < n:
+        close = text.find('"""', doc_eol + 1)
+        body_end = n if close == -1 else _line_end(text, close)
+        doc_lines.extend(
+            line.strip().replace('"""', "").strip()
+            for line in text[doc_eol + 1 : body_end].split("\n")
+        )
+    doc = "\n".join(doc_lines).strip()
+    if len(doc) > 30:
+        results.append((symbol, doc))
+    return body_end + 1
+
+
+def _read_capped(file_path: Path, max_size: int) -> str | None:
+    """Read a file as text, or return None if it is larger than max_size bytes.
+
+    One bounded read replaces a stat() + read_text() pair.
+    """
+    with open(file_path, "rb") as f:
+        data = f.read(max_size + 1)
+    if len(data) > max_size:
+        return None
+    return decode_text(data)
+
+
 def parse_code(file_path: Path, source: SourceConfig) -> list[ParsedDocument]:
     """Parse code files, extracting only documentation-valuable content."""
-    if _should_skip(file_path):
+    if _should_skip(_relative_path(file_path, source)):
         return []
 
-    if file_path.stat().st_size > _MAX_FILE_SIZE:
-        return []
-
-    text = file_path.read_text(encoding="utf-8", errors="replace")
-    if not text.strip():
+    suffix = file_path.suffix.lower()
+    is_config = suffix in _CONFIG_SUFFIXES
+    # A UTF-8 char is at most 4 bytes, so a config file over 4x the char
+    # limit can be rejected without reading all of it.
+    max_size = 4 * _MAX_CONFIG_CHARS if is_config else _MAX_FILE_SIZE
+    text = _read_capped(file_path, max_size)
+    if text is None or not text.strip():
         return []
 
-    suffix = file_path.suffix.lower()
+    uri = str(file_path)
+    tags = list(source.tags)
     docs = []
 
     # YAML/TOML/JSON: ingest whole file as config example if not too large
-    if suffix in {".yaml", ".yml", ".toml", ".json"}:
-        if len(text) < 10000:
+    if is_config:
+        if len(text) < _MAX_CONFIG_CHARS:
             docs.append(
                 ParsedDocument(
                     source_id=source.id,
                     domain=source.domain,
-                    uri=str(file_path),
+                    uri=uri,
                     title=file_path.name,
                     section="config",
                     content=text,
                     source_type=source.source_type,
                     priority=source.priority,
                     version=source.version,
-                    tags=list(source.tags),
+                    tags=tags,
                     component=source.component,
                     license=source.license,
                     origin=source.location,
@@ -164,14 +249,14 @@ def parse_code(file_path: Path, source: SourceConfig) -> list[ParsedDocument]:
                 ParsedDocument(
                     source_id=source.id,
                     domain=source.domain,
-                    uri=str(file_path),
+                    uri=uri,
                     title=f"{file_path.stem}.{symbol}",
                     section=symbol,
                     content=doc,
                     source_type=source.source_type,
                     priority=source.priority,
                     version=source.version,
-                    tags=list(source.tags),
+                    tags=tags,
                     component=source.component,
                     license=source.license,
                     origin=source.location,
@@ -185,14 +270,14 @@ def parse_code(file_path: Path, source: SourceConfig) -> list[ParsedDocument]:
                 ParsedDocument(
                     source_id=source.id,
                     domain=source.domain,
-                    uri=str(file_path),
+                    uri=uri,
                     title=f"{file_path.stem}.{symbol}",
                     section=symbol,
                     content=doc,
                     source_type=source.source_type,
                     priority=source.priority,
                     version=source.version,
-                    tags=list(source.tags),
+                    tags=tags,
                     component=source.component,
                     license=source.license,
                     origin=source.location,
@@ -214,14 +299,14 @@ def parse_code(file_path: Path, source: SourceConfig) -> list[ParsedDocument]:
                 ParsedDocument(
                     source_id=source.id,
                     domain=source.domain,
-                    uri=str(file_path),
+                    uri=uri,
                     title=file_path.name,
                     section="header",
                     content=header,
                     source_type=source.source_type,
                     priority=source.priority,
                     version=source.version,
-                    tags=list(source.tags),
+                    tags=tags,
                     component=source.component,
                     license=source.license,
                     origin=source.location,
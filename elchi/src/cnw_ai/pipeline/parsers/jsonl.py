@@ -3,29 +3,54 @@
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
+from typing import BinaryIO, Iterator
 
 from cnw_ai.pipeline.models import ParsedDocument, SourceConfig
 
+try:
+    # Pulled in by langchain (via langsmith); several times faster than json
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+_READ_SIZE = 256 * 1024
+
+
+def _iter_lines(f: BinaryIO) -> Iterator[bytes]:
+    """Yield raw lines from a binary stream, reading it in large blocks."""
+    tail = b""
+    while block := f.read(_READ_SIZE):
+        lines = (tail + block).split(b"\n")
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
 
 def parse_jsonl(file_path: Path, source: SourceConfig) -> list[ParsedDocument]:
     """Parse a JSONL file into documents (Question/Answer format)."""
     docs = []
+    tags_base = tuple(source.tags)
 
-    with open(file_path, encoding="utf-8") as f:
-        for i, line in enumerate(f):
+    with open(file_path, "rb") as f:
+        for i, line in enumerate(_iter_lines(f)):
             line = line.strip()
             if not line:
                 continue
             try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
+                entry = _json_loads(line)
+            except ValueError:  # json/orjson JSONDecodeError, bad UTF-8
                 continue
 
             instruction = entry.get("instruction", "")
             output = entry.get("output", "")
             resource = entry.get("resource", "")
             category = entry.get("category", "")
+            if isinstance(category, str):
+                # Repeated across many lines; shared by section and tags
+                category = sys.intern(category)
 
             # Topic-first format: resource and category at the top
             # so embeddings capture the subject, not just "Question: What is..."
@@ -34,9 +59,10 @@ def parse_jsonl(file_path: Path, source: SourceConfig) -> list[ParsedDocument]:
                 header = f"{resource} - {category}" if resource else category
             content = f"{header}\n\n{instruction}\n\n{output}"
 
-            tags = list(source.tags)
-            if category and category not in tags:
-                tags.append(category)
+            if category and category not in tags_base:
+                tags = [*tags_base, category]
+            else:
+                tags = list(tags_base)
 
             docs.append(
                 ParsedDocument(
@@ -50,7 +76,7 @@ def parse_jsonl(file_path: Path, source: SourceConfig) -> list[ParsedDocument]:
                     priority=source.priority,
                     version=source.version,
                     tags=tags,
-                    component=source.component or resource.lower(),
+                    component=source.component or sys.intern(resource.lower()),
                     license=source.license,
                     origin=source.location,
                 )
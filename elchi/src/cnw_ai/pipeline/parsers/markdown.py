@@ -6,6 +6,7 @@ import re
 from pathlib import Path
 
 from cnw_ai.pipeline.models import ParsedDocument, SourceConfig
+from cnw_ai.utils.files import read_text
 
 
 _HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
@@ -17,24 +18,24 @@ _RST_UNDERLINE_CHARS = set("=-~^`_*+#")
 def _split_markdown_sections(text: str) -> list[tuple[str, str]]:
     """Split markdown text into (heading, body) sections."""
     sections: list[tuple[str, str]] = []
-    matches = list(_HEADING_RE.finditer(text))
+    heading: str | None = None  # None until the first heading is seen
+    body_start = 0
 
-    if not matches:
+    for match in _HEADING_RE.finditer(text):
+        # Close the section before this heading (the preamble for the first one)
+        body = text[body_start : match.start()].strip()
+        if body:
+            sections.append((heading or "", body))
+        heading = match.group(2).strip()
+        body_start = match.end()
+
+    if heading is None:
         # No headings, return entire text as one section
         return [("", text.strip())]
 
-    # Text before first heading
-    preamble = text[: matches[0].start()].strip()
-    if preamble:
-        sections.append(("", preamble))
-
-    for i, match in enumerate(matches):
-        heading = match.group(2).strip()
-        start = match.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        body = text[start:end].strip()
-        if body:
-            sections.append((heading, body))
+    body = text[body_start:].strip()
+    if body:
+        sections.append((heading, body))
 
     return sections
 
@@ -52,8 +53,10 @@ def _split_rst_sections(text: str) -> list[tuple[str, str]]:
         if (
             i + 1 < len(lines)
             and len(lines[i + 1]) >= 2
-            and len(set(lines[i + 1].strip())) == 1
-            and lines[i + 1].strip()[0] in _RST_UNDERLINE_CHARS
+            and (underline := lines[i + 1].strip())
+            and underline[0] in _RST_UNDERLINE_CHARS
+            # a single repeated character: nothing left once it is stripped
+            and not underline.strip(underline[0])
             and lines[i].strip()
         ):
             # Save previous section
@@ -78,7 +81,7 @@ def _split_rst_sections(text: str) -> list[tuple[str, str]]:
 
 def parse_markdown(file_path: Path, source: SourceConfig) -> list[ParsedDocument]:
     """Parse a markdown or RST file into section-based documents."""
-    text = file_path.read_text(encoding="utf-8", errors="replace")
+    text = read_text(file_path)
     if not text.strip():
         return []
 
@@ -89,6 +92,7 @@ def parse_markdown(file_path: Path, source: SourceConfig) -> list[ParsedDocument
     else:
         sections = _split_markdown_sections(text)
 
+    tags = list(source.tags)
     docs = []
     for heading, body in sections:
         if not body or len(body) < 20:
@@ -104,7 +108,7 @@ def parse_markdown(file_path: Path, source: SourceConfig) -> list[ParsedDocument
                 source_type=source.source_type,
                 priority=source.priority,
                 version=source.version,
-                tags=list(source.tags),
+                tags=tags,
                 component=source.component,
                 license=source.license,
                 origin=source.location,
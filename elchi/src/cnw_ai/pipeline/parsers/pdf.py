@@ -18,6 +18,7 @@ def parse_pdf(file_path: Path, source: SourceConfig) -> list[ParsedDocument]:
         log.warning("pymupdf_not_installed", hint="Install with: pip install pymupdf")
         return []
 
+    tags = list(source.tags)
     docs = []
     try:
         doc = pymupdf.open(str(file_path))
@@ -37,7 +38,7 @@ def parse_pdf(file_path: Path, source: SourceConfig) -> list[ParsedDocument]:
                     source_type=source.source_type,
                     priority=source.priority,
                     version=source.version,
-                    tags=list(source.tags),
+                    tags=tags,
                     component=source.component,
                     license=source.license,
                     origin=source.location,
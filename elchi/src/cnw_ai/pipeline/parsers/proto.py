@@ -6,11 +6,23 @@ Handles nested messages, oneof, reserved, options, multi-line comments.
 
 from __future__ import annotations
 
+import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
+from typing import Iterator
 
 from cnw_ai.pipeline.models import ParsedDocument, SourceConfig
+from cnw_ai.utils.files import read_text
+
+
+_BLOCK_START_RE = re.compile(r"(message|enum|service)\s+(\w+)")
+_ONEOF_RE = re.compile(r"oneof\s+(\w+)")
+# "<type> <name> = <number>" from the start of the line; options excluded
+_FIELD_RE = re.compile(r"(?!option\b)[\w.<>, ]+\s(\w+)\s*=\s*\d")
+# Top-level statements that keep pending comments attached to the next block
+_TOP_LEVEL_KEEP = ("syntax", "package", "import", "option")
 
 
 class _State(Enum):
@@ -32,10 +44,12 @@ class _Block:
     depth: int = 0  # brace nesting depth within this block
 
 
-def _parse_proto_blocks(text: str) -> list[_Block]:
-    """Parse proto file into blocks using a line-based state machine."""
+def _iter_proto_blocks(text: str) -> Iterator[_Block]:
+    """Parse proto file into blocks using a line-based state machine.
+
+    Blocks are yielded as soon as their closing brace is seen.
+    """
     lines = text.split("\n")
-    blocks: list[_Block] = []
     pending_comments: list[str] = []
     block_stack: list[_Block] = []
     in_block_comment = False
@@ -63,78 +77,72 @@ def _parse_proto_blocks(text: str) -> list[_Block]:
             continue
 
         # Block start: message, enum, service
-        for keyword in ("message", "enum", "service"):
-            if stripped.startswith(keyword + " "):
-                rest = stripped[len(keyword) :].strip()
-                name = rest.split("{")[0].strip().split()[0] if rest else "unknown"
-                block = _Block(
-                    gtype=keyword,
-                    name=name,
-                    leading_comments=list(pending_comments),
-                    depth=0,
-                )
-                pending_comments.clear()
-
-                if block_stack:
-                    # Nested block: track it
-                    block_stack[-1].lines.append(stripped)
-
-                block_stack.append(block)
-                # Count opening braces on this line
-                block.depth += stripped.count("{") - stripped.count("}")
-                if block.depth <= 0:
-                    # Single-line block
-                    block_stack.pop()
-                    blocks.append(block)
-                break
-        else:
-            # Not a block start line
-            if not block_stack:
-                # Top-level non-block line: clear pending comments unless meaningful
-                if stripped and not stripped.startswith("syntax") and not stripped.startswith("package") and not stripped.startswith("import") and not stripped.startswith("option"):
-                    pending_comments.clear()
-                continue
+        if m := _BLOCK_START_RE.match(stripped):
+            block = _Block(
+                # Interned: carried by every ParsedDocument/ChunkDoc of the block
+                gtype=sys.intern(m.group(1)),
+                name=m.group(2),
+                leading_comments=pending_comments,
+                depth=0,
+            )
+            # Hand the list over to the block instead of copying it
+            pending_comments = []
+
+            if block_stack:
+                # Nested block: track it
+                block_stack[-1].lines.append(stripped)
+
+            block_stack.append(block)
+            # Count opening braces on this line
+            block.depth += stripped.count("{") - stripped.count("}")
+            if block.depth <= 0:
+                # Single-line block
+                block_stack.pop()
+                yield block
+            continue
 
-            current = block_stack[-1]
-            current.lines.append(stripped)
+        # Not a block start line
+        if not block_stack:
+            # Top-level non-block line: clear pending comments unless meaningful
+            if stripped and not stripped.startswith(_TOP_LEVEL_KEEP):
+                pending_comments.clear()
+            continue
 
-            # Track brace depth
-            current.depth += stripped.count("{") - stripped.count("}")
+        current = block_stack[-1]
+        current.lines.append(stripped)
 
-            # Extract field info
-            if "deprecated" in stripped.lower():
-                current.deprecated = True
+        # Track brace depth
+        current.depth += stripped.count("{") - stripped.count("}")
 
-            if stripped.startswith("oneof "):
-                oneof_name = stripped.split()[1].rstrip("{").strip()
-                current.oneofs.append(oneof_name)
+        # Extract field info
+        if "deprecated" in stripped.lower():
+            current.deprecated = True
 
-            # Named fields (simplified: lines with = and ;)
-            if "=" in stripped and stripped.endswith(";"):
-                field_name = stripped.split("=")[0].strip().split()
-                if len(field_name) >= 2:
-                    current.fields.append(field_name[-1])
+        if m := _ONEOF_RE.match(stripped):
+            current.oneofs.append(m.group(1))
 
-            # Block end
-            if current.depth <= 0:
-                block_stack.pop()
-                if not block_stack:
-                    blocks.append(current)
-                # else: nested block finished, parent continues
+        # Named fields (enum values have no type); trailing comments ignored
+        if "=" in stripped and (m := _FIELD_RE.match(stripped.partition("//")[0])):
+            current.fields.append(m.group(1))
 
-    return blocks
+        # Block end
+        if current.depth <= 0:
+            block_stack.pop()
+            if not block_stack:
+                yield current
+            # else: nested block finished, parent continues
 
 
 def parse_proto(file_path: Path, source: SourceConfig) -> list[ParsedDocument]:
     """Parse a .proto file into documents per block."""
-    text = file_path.read_text(encoding="utf-8", errors="replace")
-    if not text.strip():
+    text = read_text(file_path)
+    if not text or text.isspace():
         return []
 
-    blocks = _parse_proto_blocks(text)
+    tags = list(source.tags)
     docs = []
 
-    for block in blocks:
+    for block in _iter_proto_blocks(text):
         # Build content: leading comments + block source
         parts = []
         if block.leading_comments:
@@ -159,7 +167,7 @@ def parse_proto(file_path: Path, source: SourceConfig) -> list[ParsedDocument]:
                 source_type=source.source_type,
                 priority=source.priority,
                 version=source.version,
-                tags=list(source.tags),
+                tags=tags,
                 component=source.component,
                 license=source.license,
                 origin=source.location,
@@ -184,7 +192,7 @@ def parse_proto(file_path: Path, source: SourceConfig) -> list[ParsedDocument]:
                 source_type=source.source_type,
                 priority=source.priority,
                 version=source.version,
-                tags=list(source.tags),
+                tags=tags,
                 component=source.component,
                 license=source.license,
                 origin=source.location,
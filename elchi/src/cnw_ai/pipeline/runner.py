@@ -2,22 +2,40 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from pathlib import Path
+from typing import Iterator
+
+from cnw_ai.config import (
+    INGEST_BATCH_SIZE,
+    PARALLEL_PARSE_MIN_FILES,
+    UPSERT_MAX_PENDING,
+)
 from cnw_ai.pipeline.chunker import chunk_documents
-from cnw_ai.pipeline.embedder import detect_embedding_dim, embed_chunks
+from cnw_ai.pipeline.embedder import detect_embedding_dim, embed_batches
 from cnw_ai.pipeline.fetcher import fetch
-from cnw_ai.pipeline.models import PipelineResult, SourceConfig
+from cnw_ai.pipeline.models import ParsedDocument, PipelineResult, SourceConfig
 from cnw_ai.pipeline.parsers import parse_file
 from cnw_ai.pipeline.store import (
     delete_by_source,
     ensure_collection,
     get_client,
-    get_existing_hashes,
+    get_existing_hashes_by_source,
     upsert_chunks,
 )
-from cnw_ai.utils.logging import get_logger
+from cnw_ai.utils.logging import get_logger, setup_logging
 
 log = get_logger(__name__)
 
+_PARSE_WORKERS = os.cpu_count() or 1
+
 
 class PipelineRunner:
     """Orchestrate the full ingest pipeline."""
@@ -29,21 +47,40 @@ class PipelineRunner:
         dry_run: bool = False,
         reindex: bool = False,
         max_items: int = 0,
+        parallel: bool = True,
+        verbose: bool = False,
     ):
         self.sources = sources
         self.dry_run = dry_run
         self.reindex = reindex
         self.max_items = max_items
+        self.parallel = parallel
+        self.verbose = verbose
+        self._parse_pool: ProcessPoolExecutor | None = None
+        self._existing_hashes: dict[str, set[str]] = {}
 
     def run(self) -> PipelineResult:
+        try:
+            return self._run()
+        finally:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(cancel_futures=True)
+                self._parse_pool = None
+
+    def _run(self) -> PipelineResult:
         result = PipelineResult()
 
         if not self.dry_run:
             client = get_client()
             dim = detect_embedding_dim()
             ensure_collection(client, dim=dim)
+            if not self.reindex:
+                # One scroll for every source instead of one per source
+                self._existing_hashes = get_existing_hashes_by_source(
+                    client, [s.id for s in self.sources]
+                )
 
-        for source in self.sources:
+        for source, files, fetch_error in self._prefetch():
             log.info(
                 "processing_source",
                 source_id=source.id,
@@ -51,7 +88,11 @@ class PipelineRunner:
                 source_type=source.source_type,
             )
             try:
-                self._process_source(source, result, client if not self.dry_run else None)
+                if fetch_error is not None:
+                    raise fetch_error
+                self._process_source(
+                    source, files, result, client if not self.dry_run else None
+                )
             except Exception as e:
                 msg = f"[{source.id}] {e}"
                 log.error("source_error", source_id=source.id, error=str(e))
@@ -61,60 +102,177 @@ class PipelineRunner:
 
         return result
 
+    def _prefetch(self) -> Iterator[tuple[SourceConfig, list[Path], Exception | None]]:
+        """Fetch sources in a background thread, one source ahead of processing.
+
+        Fetching is I/O bound (git clone/pull, HTTP), so the next source is
+        downloaded while the current one is parsed, embedded and upserted.
+        The thread waits for each fetched source to be taken before starting
+        the next, and stops once the generator is closed.
+        """
+        fetched: queue.Queue = queue.Queue()
+        taken = threading.Semaphore(0)
+        stop = threading.Event()
+
+        def fetch_all() -> None:
+            for source in self.sources:
+                try:
+                    item = (source, fetch(source, max_items=self.max_items), None)
+                except Exception as e:
+                    item = (source, [], e)
+                fetched.put(item)
+                taken.acquire()
+                if stop.is_set():
+                    return
+            fetched.put(None)
+
+        thread = threading.Thread(target=fetch_all, name="fetch", daemon=True)
+        thread.start()
+        try:
+            while (item := fetched.get()) is not None:
+                taken.release()
+                yield item
+            thread.join()
+        finally:
+            stop.set()
+            taken.release()
+
+    def _parse_files(
+        self, files: list[Path], source: SourceConfig
+    ) -> list[ParsedDocument]:
+        """Parse a batch of files, fanning out to worker processes when large."""
+        if (
+            not self.parallel
+            or _PARSE_WORKERS < 2
+            or len(files) < PARALLEL_PARSE_MIN_FILES
+        ):
+            return [doc for file_path in files for doc in parse_file(file_path, source)]
+
+        if self._parse_pool is None:
+            # spawn, not fork: the prefetch thread may hold locks at fork time
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=_PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=setup_logging,
+                initargs=(self.verbose,),
+            )
+        chunksize = max(1, len(files) // (4 * _PARSE_WORKERS))
+        try:
+            parsed = self._parse_pool.map(
+                parse_file, files, repeat(source), chunksize=chunksize
+            )
+            return [doc for docs in parsed for doc in docs]
+        except BrokenProcessPool:
+            # A worker died (OOM, crash in a C extension). The executor stays
+            # broken, so drop it and let the next batch start a fresh pool;
+            # no serial retry, as that could take down this process too.
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+            raise
+
     def _process_source(
         self,
         source: SourceConfig,
+        files: list[Path],
         result: PipelineResult,
         client,
     ) -> None:
-        # 1. Fetch
-        files = fetch(source, max_items=self.max_items)
+        # 1. Fetch (done ahead of time by _prefetch)
         result.files_fetched += len(files)
         log.info("files_fetched", source_id=source.id, count=len(files))
 
-        # 2. Parse
-        all_docs = []
-        for file_path in files:
-            docs = parse_file(file_path, source)
-            all_docs.extend(docs)
-        result.documents_parsed += len(all_docs)
-        log.info("documents_parsed", source_id=source.id, count=len(all_docs))
+        existing_hashes: set[str] | None = None
+        docs_parsed = chunks_created = skipped = upserted = 0
+        pending: deque[Future[int]] = deque()
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="upsert") as upserter:
+            try:
+                for i in range(0, len(files), INGEST_BATCH_SIZE):
+                    # 2. Parse
+                    docs = self._parse_files(files[i : i + INGEST_BATCH_SIZE], source)
+                    result.documents_parsed += len(docs)
+                    docs_parsed += len(docs)
+                    if not docs:
+                        continue
+
+                    # 3. Chunk
+                    chunks = chunk_documents(docs)
+                    result.chunks_created += len(chunks)
+                    chunks_created += len(chunks)
+
+                    if self.dry_run:
+                        continue
+
+                    # 4. Dedup: check existing hashes (loaded once per run)
+                    if existing_hashes is None:
+                        if self.reindex:
+                            # Reindex: delete all existing points for this source
+                            delete_by_source(client, source.id)
+                            existing_hashes = set()
+                        else:
+                            existing_hashes = self._existing_hashes.get(source.id, set())
+                    if existing_hashes:
+                        before = len(chunks)
+                        chunks = [c for c in chunks if c.text_hash not in existing_hashes]
+                        result.chunks_skipped_dedup += before - len(chunks)
+                        skipped += before - len(chunks)
+
+                    if not chunks:
+                        continue
+
+                    # 5. Embed, 6. Upsert: the next batch embeds while this one upserts
+                    for batch, vectors in embed_batches(chunks):
+                        result.chunks_embedded += len(vectors)
+                        pending.append(upserter.submit(upsert_chunks, client, batch, vectors))
+                        upserted += self._collect_upserts(pending, UPSERT_MAX_PENDING, result)
+
+                upserted += self._collect_upserts(pending, 0, result)
+            finally:
+                # Only non-empty on error: stop queued writes, count finished ones
+                if pending:
+                    self._abandon_upserts(pending, result)
 
-        if not all_docs:
+        log.info("documents_parsed", source_id=source.id, count=docs_parsed)
+        if not docs_parsed:
             log.warning("no_documents", source_id=source.id)
             return
-
-        # 3. Chunk
-        chunks = chunk_documents(all_docs)
-        result.chunks_created += len(chunks)
-        log.info("chunks_created", source_id=source.id, count=len(chunks))
+        log.info("chunks_created", source_id=source.id, count=chunks_created)
 
         if self.dry_run:
-            log.info("dry_run_skip", source_id=source.id, chunks=len(chunks))
+            log.info("dry_run_skip", source_id=source.id, chunks=chunks_created)
             return
-
-        # 4. Dedup: check existing hashes
-        if not self.reindex:
-            existing_hashes = get_existing_hashes(client, source.id)
-            if existing_hashes:
-                before = len(chunks)
-                chunks = [c for c in chunks if c.text_hash not in existing_hashes]
-                skipped = before - len(chunks)
-                result.chunks_skipped_dedup += skipped
-                if skipped:
-                    log.info("dedup_skipped", source_id=source.id, skipped=skipped)
+        if skipped:
+            log.info("dedup_skipped", source_id=source.id, skipped=skipped)
+        if not upserted:
+            log.info("no_new_chunks", source_id=source.id)
         else:
-            # Reindex: delete all existing points for this source
-            delete_by_source(client, source.id)
+            log.info("chunks_upserted", source_id=source.id, count=upserted)
 
-        if not chunks:
-            log.info("no_new_chunks", source_id=source.id)
-            return
+    @staticmethod
+    def _collect_upserts(
+        pending: deque[Future[int]], limit: int, result: PipelineResult
+    ) -> int:
+        """Wait for the oldest upserts until at most ``limit`` are in flight."""
+        upserted = 0
+        while len(pending) > limit:
+            count = pending.popleft().result()
+            result.chunks_upserted += count
+            upserted += count
+        return upserted
 
-        # 5. Embed
-        vectors = embed_chunks(chunks)
-        result.chunks_embedded += len(vectors)
+    @staticmethod
+    def _abandon_upserts(pending: deque[Future[int]], result: PipelineResult) -> None:
+        """Cancel upserts that haven't started and count those that still land.
 
-        # 6. Upsert
-        upserted = upsert_chunks(client, chunks, vectors)
-        result.chunks_upserted += upserted
+        Called while an error is propagating, so their own failures are dropped.
+        """
+        for future in pending:
+            future.cancel()
+        while pending:
+            future = pending.popleft()
+            if future.cancelled():
+                continue
+            try:
+                result.chunks_upserted += future.result()
+            except Exception:
+                pass
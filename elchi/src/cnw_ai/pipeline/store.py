@@ -16,43 +16,48 @@ def get_client(url: str = QDRANT_URL) -> QdrantClient:
     return QdrantClient(url=url)
 
 
+# Payload indexes for filtering; fields live under the nested "metadata" dict
+_PAYLOAD_INDEXES = [
+    ("metadata.domain", models.PayloadSchemaType.KEYWORD),
+    ("metadata.source_id", models.PayloadSchemaType.KEYWORD),
+    ("metadata.source_type", models.PayloadSchemaType.KEYWORD),
+    ("metadata.component", models.PayloadSchemaType.KEYWORD),
+    ("metadata.tags", models.PayloadSchemaType.KEYWORD),
+    ("metadata.priority", models.PayloadSchemaType.INTEGER),
+    ("metadata.text_hash", models.PayloadSchemaType.KEYWORD),
+]
+
+
 def ensure_collection(
     client: QdrantClient,
     collection_name: str = COLLECTION_NAME,
     dim: int = EMBEDDING_DIM,
 ) -> None:
-    """Create collection if it doesn't exist, with payload indexes."""
+    """Create collection if it doesn't exist, plus any missing payload indexes."""
     collections = [c.name for c in client.get_collections().collections]
 
     if collection_name in collections:
         log.info("collection_exists", name=collection_name)
-        return
-
-    log.info("creating_collection", name=collection_name, dim=dim)
-    client.create_collection(
-        collection_name=collection_name,
-        vectors_config=models.VectorParams(
-            size=dim,
-            distance=models.Distance.COSINE,
-        ),
-    )
+    else:
+        log.info("creating_collection", name=collection_name, dim=dim)
+        client.create_collection(
+            collection_name=collection_name,
+            vectors_config=models.VectorParams(
+                size=dim,
+                distance=models.Distance.COSINE,
+            ),
+        )
 
-    # Create payload indexes for filtering
-    for field, schema in [
-        ("domain", models.PayloadSchemaType.KEYWORD),
-        ("source_id", models.PayloadSchemaType.KEYWORD),
-        ("source_type", models.PayloadSchemaType.KEYWORD),
-        ("component", models.PayloadSchemaType.KEYWORD),
-        ("tags", models.PayloadSchemaType.KEYWORD),
-        ("priority", models.PayloadSchemaType.INTEGER),
-        ("text_hash", models.PayloadSchemaType.KEYWORD),
-    ]:
+    existing = client.get_collection(collection_name).payload_schema or {}
+    missing = [(f, schema) for f, schema in _PAYLOAD_INDEXES if f not in existing]
+    for field, schema in missing:
         client.create_payload_index(
             collection_name=collection_name,
             field_name=field,
             field_schema=schema,
         )
-    log.info("indexes_created", collection=collection_name)
+    if missing:
+        log.info("indexes_created", collection=collection_name, count=len(missing))
 
 
 def delete_by_source(
@@ -68,7 +73,7 @@ def delete_by_source(
             filter=models.Filter(
                 must=[
                     models.FieldCondition(
-                        key="source_id",
+                        key="metadata.source_id",
                         match=models.MatchValue(value=source_id),
                     )
                 ]
@@ -83,7 +88,17 @@ def get_existing_hashes(
     collection_name: str = COLLECTION_NAME,
 ) -> set[str]:
     """Get existing text_hash values for a source (for dedup)."""
-    hashes: set[str] = set()
+    by_source = get_existing_hashes_by_source(client, [source_id], collection_name)
+    return by_source.get(source_id, set())
+
+
+def get_existing_hashes_by_source(
+    client: QdrantClient,
+    source_ids: list[str],
+    collection_name: str = COLLECTION_NAME,
+) -> dict[str, set[str]]:
+    """Get existing text_hash values for many sources with a single scroll."""
+    hashes: dict[str, set[str]] = {}
     offset = None
 
     while True:
@@ -92,22 +107,23 @@ def get_existing_hashes(
             scroll_filter=models.Filter(
                 must=[
                     models.FieldCondition(
-                        key="source_id",
-                        match=models.MatchValue(value=source_id),
+                        key="metadata.source_id",
+                        match=models.MatchAny(any=list(source_ids)),
                     )
                 ]
             ),
-            limit=1000,
+            limit=10000,
             offset=offset,
-            with_payload=["text_hash"],
+            with_payload=["metadata.source_id", "metadata.text_hash"],
             with_vectors=False,
         )
 
         points, next_offset = result
         for point in points:
-            h = point.payload.get("text_hash", "")
+            meta = point.payload.get("metadata", {})
+            h = meta.get("text_hash", "")
             if h:
-                hashes.add(h)
+                hashes.setdefault(meta.get("source_id", ""), set()).add(h)
 
         if next_offset is None:
             break
@@ -123,26 +139,26 @@ def upsert_chunks(
     collection_name: str = COLLECTION_NAME,
     batch_size: int = UPSERT_BATCH_SIZE,
 ) -> int:
-    """Upsert chunks with their vectors into Qdrant."""
+    """Upsert chunks with their vectors into Qdrant.
+
+    Each batch is sent in Qdrant's columnar form (ids / vectors / payloads
+    lists) rather than as one PointStruct model per chunk.
+    """
     total = len(chunks)
     upserted = 0
 
     for i in range(0, total, batch_size):
         batch_chunks = chunks[i : i + batch_size]
-        batch_vectors = vectors[i : i + batch_size]
 
-        points = [
-            models.PointStruct(
-                id=chunk.chunk_id,
-                vector=vector,
-                payload=chunk.to_payload(),
-            )
-            for chunk, vector in zip(batch_chunks, batch_vectors)
-        ]
+        batch = models.Batch(
+            ids=[chunk.chunk_id for chunk in batch_chunks],
+            vectors=vectors[i : i + batch_size],
+            payloads=[chunk.to_payload() for chunk in batch_chunks],
+        )
 
-        client.upsert(collection_name=collection_name, points=points)
-        upserted += len(points)
-        log.debug("upserted_batch", batch=f"{i}-{i + len(points)}/{total}")
+        client.upsert(collection_name=collection_name, points=batch)
+        upserted += len(batch_chunks)
+        log.debug("upserted_batch", batch=f"{i}-{i + len(batch_chunks)}/{total}")
 
-    log.info("upserted", count=upserted)
+    log.debug("upserted", count=upserted)
     return upserted
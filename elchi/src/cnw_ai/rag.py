@@ -1,5 +1,7 @@
 """RAG pipeline: retrieve relevant docs from Qdrant and query Ollama."""
 
+from functools import cache
+
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnablePassthrough
@@ -36,6 +38,7 @@ Answer:"""
 PROMPT = ChatPromptTemplate.from_template(SYSTEM_PROMPT)
 
 
+@cache
 def get_qdrant_client() -> QdrantClient:
     """Get a Qdrant client."""
     return QdrantClient(url=QDRANT_URL)
@@ -48,6 +51,7 @@ class _PrefixedEmbeddings(OllamaEmbeddings):
         return super().embed_query(f"search_query: {text}")
 
 
+@cache
 def get_vectorstore() -> QdrantVectorStore:
     """Load existing Qdrant collection."""
     embeddings = _PrefixedEmbeddings(model=EMBEDDING_MODEL, base_url=OLLAMA_BASE_URL)
@@ -76,44 +80,77 @@ def _dedup_and_rerank(docs, boost_factor: float = 0.1):
             seen_hashes.add(h)
         unique_docs.append(doc)
 
-    # Rerank by priority
-    for doc in unique_docs:
-        priority = doc.metadata.get("priority", 3)
-        boost = 1 + boost_factor * (5 - priority)
-        doc.metadata["_boosted_score"] = boost
-    unique_docs.sort(key=lambda d: d.metadata.get("_boosted_score", 1), reverse=True)
+    # Rerank by priority; sort() evaluates the key once per doc and is stable,
+    # so equal boosts keep their vector-score order
+    def boost(doc) -> float:
+        return 1 + boost_factor * (5 - doc.metadata.get("priority", 3))
+
+    unique_docs.sort(key=boost, reverse=True)
     return unique_docs
 
 
+@cache
 def get_retriever():
     """Get the retriever from vectorstore with priority reranking."""
     vectorstore = get_vectorstore()
     return vectorstore.as_retriever(search_kwargs={"k": TOP_K})
 
 
-def get_chain():
-    """Build the RAG chain using LCEL."""
-    retriever = get_retriever()
-    llm = ChatOllama(
+@cache
+def get_llm() -> ChatOllama:
+    """Get the chat model."""
+    return ChatOllama(
         model=LLM_MODEL,
         base_url=OLLAMA_BASE_URL,
     )
 
+
+@cache
+def get_answer_chain():
+    """Build the generation step: {"context", "question"} -> answer text."""
+    return PROMPT | get_llm() | StrOutputParser()
+
+
+@cache
+def get_chain():
+    """Build the RAG chain using LCEL."""
+    retriever = get_retriever()
+
     chain = (
         {"context": retriever | _dedup_and_rerank | _format_docs, "question": RunnablePassthrough()}
-        | PROMPT
-        | llm
-        | StrOutputParser()
+        | get_answer_chain()
     )
     return chain
 
 
+def reset_cache() -> None:
+    """Drop the cached clients, models and chains built by the get_* factories."""
+    for factory in (
+        get_qdrant_client,
+        get_vectorstore,
+        get_retriever,
+        get_llm,
+        get_answer_chain,
+        get_chain,
+    ):
+        factory.cache_clear()
+
+
+def retrieve(question: str, retriever=None) -> list:
+    """Retrieve, deduplicate and rerank the context documents for a question."""
+    retriever = retriever or get_retriever()
+    return _dedup_and_rerank(retriever.invoke(question))
+
+
+def generate(question: str, docs, answer_chain=None) -> str:
+    """Answer a question from already retrieved documents."""
+    answer_chain = answer_chain or get_answer_chain()
+    return answer_chain.invoke({"context": _format_docs(docs), "question": question})
+
+
 def ask(question: str) -> dict:
     """Ask a question and return the answer with source documents."""
-    retriever = get_retriever()
-    chain = get_chain()
-
-    docs = retriever.invoke(question)
-    docs = _dedup_and_rerank(docs)
-    answer = chain.invoke(question)
+    # Retrieve once and reuse the docs for both the prompt and the sources
+    docs = retrieve(question)
+    answer = generate(question, docs)
     return {"answer": answer, "source_documents": docs}
@@ -1,7 +1,10 @@
-"""Deterministic hashing for chunk IDs and dedup."""
+"""Deterministic hashing for chunk IDs and dedup.
+
+Both values are persisted in Qdrant (point IDs and payload text_hash), so
+changing the algorithm or normalization requires a full --reindex.
+"""
 
 import hashlib
-import re
 
 
 def make_chunk_id(source_id: str, uri: str, section: str, chunk_index: int) -> str:
@@ -13,11 +16,14 @@ def make_chunk_id(source_id: str, uri: str, section: str, chunk_index: int) -> s
     share the same uri (e.g. markdown sections from one file).
     """
     key = f"{source_id}::{uri}::{section}::{chunk_index}"
-    h = hashlib.sha256(key.encode()).hexdigest()[:32]
+    # Slice the UUID groups straight from the full digest; no [:32] copy
+    h = hashlib.sha256(key.encode()).hexdigest()
     return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
 
 
 def text_hash(text: str) -> str:
     """Generate a hash of normalized text for dedup."""
-    normalized = re.sub(r"\s+", " ", text.strip().lower())
+    # Same result as re.sub(r"\s+", " ", text.strip().lower()): str.split()
+    # uses the same Unicode whitespace set as \s, so stored hashes still match.
+    normalized = " ".join(text.lower().split())
     return hashlib.sha256(normalized.encode()).hexdigest()[:16]
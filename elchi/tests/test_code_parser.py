@@ -0,0 +1,116 @@
+"""Tests for the code parser."""
+
+from dataclasses import replace
+from pathlib import Path
+from textwrap import dedent
+
+from cnw_ai.pipeline.parsers.code import (
+    _extract_go_docs,
+    _extract_python_docs,
+    _should_skip,
+    parse_code,
+)
+
+
+def test_skip_vendor_and_generated():
+    assert _should_skip(Path("repo/vendor/github.com/x/y.go"))
+    assert _should_skip(Path("repo/node_modules/pkg/index.js"))
+    assert _should_skip(Path("repo/pkg/__pycache__/mod.py"))
+    assert _should_skip(Path("repo/api/v1/types.pb.go"))
+    assert _should_skip(Path("repo/api/v1/types.pb.validate.go"))
+    assert _should_skip(Path("repo/ui/schema.generated.ts"))
+
+
+def test_skip_test_files():
+    assert _should_skip(Path("repo/pkg/server_test.go"))
+    assert _should_skip(Path("repo/pkg/test_server.py"))
+    assert _should_skip(Path("repo/pkg/server_test.py"))
+    assert _should_skip(Path("repo/tests/conftest.py"))
+
+
+def test_keep_regular_files():
+    assert not _should_skip(Path("repo/pkg/server.go"))
+    assert not _should_skip(Path("repo/pkg/latest_release.py"))
+    assert not _should_skip(Path("repo/vendored.go"))
+    assert not _should_skip(Path("repo/docs/protobuf.md"))
+
+
+def test_go_doc_comments():
+    text = dedent("""\
+        package server
+
+        x := 1 // trailing comment, not a doc
+        // Serve starts the HTTP listener and blocks
+        // until the context is cancelled.
+        func Serve(ctx context.Context) error {
+            // inline comment inside the body of the function
+            return nil
+        }
+
+        // This comment is separated from the declaration by a blank line.
+
+        type Config struct{}
+    """)
+    assert _extract_go_docs(text) == [
+        ("Serve", "Serve starts the HTTP listener and blocks\nuntil the context is cancelled."),
+    ]
+
+
+def test_python_docstrings():
+    text = dedent('''\
+        class Server:
+
+            """Serve HTTP requests for the admin API endpoints."""
+
+            def start(self):
+                """Start the listener.
+
+                Blocks until the server is shut down.
+                """
+
+            def stop(self):
+                pass
+    ''')
+    assert _extract_python_docs(text) == [
+        ("Server", "Serve HTTP requests for the admin API endpoints."),
+        ("start", "Start the listener.\n\nBlocks until the server is shut down."),
+    ]
+
+
+def test_python_docstrings_ignore_other_string_literals():
+    text = dedent('''\
+        SQL = """SELECT name, value FROM settings WHERE scope = 'global'"""
+
+        def query(conn):
+            return conn.execute(SQL)
+
+        def render():
+            x = 1
+            """Not a docstring: it does not open on the line after the def."""
+    ''')
+    assert _extract_python_docs(text) == []
+
+
+def test_config_files_kept_only_when_small(tmp_path, sample_source):
+    small = tmp_path / "small.json"
+    small.write_text('{"listener": {"port": 8080}}')
+    large = tmp_path / "large.json"
+    large.write_text('{"items": [' + ", ".join(["1"] * 20_000) + "]}")
+
+    docs = parse_code(small, sample_source)
+    assert [d.section for d in docs] == ["config"]
+    assert docs[0].content == small.read_text()
+    assert parse_code(large, sample_source) == []
+
+
+def test_skip_patterns_ignore_directories_above_source_root(tmp_path, sample_source):
+    root = tmp_path / "tests" / "proj"
+    (root / "tests").mkdir(parents=True)
+    kept = root / "config.json"
+    kept.write_text('{"listener": {"port": 8080}}')
+    skipped = root / "tests" / "fixture.json"
+    skipped.write_text('{"listener": {"port": 9090}}')
+    source = replace(sample_source, location=str(root))
+
+    assert [d.uri for d in parse_code(kept, source)] == [str(kept)]
+    assert parse_code(skipped, source) == []
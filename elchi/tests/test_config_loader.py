@@ -1,10 +1,13 @@
 """Tests for the config loader."""
 
+from datetime import date
 from pathlib import Path
 
 import pytest
+import yaml
 
-from cnw_ai.pipeline.config_loader import filter_sources, load_sources
+from cnw_ai.pipeline import config_loader
+from cnw_ai.pipeline.config_loader import _EventLoader, filter_sources, load_sources
 
 
 def _write_yaml(tmp_path: Path, content: str) -> Path:
@@ -96,3 +99,78 @@ sources:
     filtered = filter_sources(sources, source_ids=["b"])
     assert len(filtered) == 1
     assert filtered[0].id == "b"
+
+
+def test_missing_sources_key(tmp_path):
+    p = _write_yaml(tmp_path, """
+settings:
+  workers: 4
+""")
+    with pytest.raises(ValueError, match="must contain 'sources'"):
+        load_sources(p)
+
+
+def test_sources_after_other_keys_with_anchor(tmp_path):
+    p = _write_yaml(tmp_path, """
+defaults: &defaults
+  domain: envoy
+  priority: 2
+  source_type: local
+  tags: [docs]
+sources:
+  - <<: *defaults
+    id: a
+    location: /tmp/a
+trailing: true
+""")
+    sources = load_sources(p)
+    assert len(sources) == 1
+    assert sources[0].domain == "envoy"
+    assert sources[0].tags == ["docs"]
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+def test_uses_libyaml_parser():
+    from yaml.cyaml import CParser
+
+    assert issubclass(_EventLoader, CParser)
+
+
+def test_load_uses_json_cache_until_yaml_changes(tmp_path, monkeypatch):
+    p = _write_yaml(tmp_path, """
+sources:
+  - id: first
+    domain: test
+    priority: 1
+    source_type: local
+    location: /tmp/test
+""")
+    first = load_sources(p)
+    assert (tmp_path / "sources.yaml.cache.json").exists()
+
+    def no_yaml(stream, config_path):
+        raise AssertionError("YAML parsed despite a valid cache")
+
+    with monkeypatch.context() as m:
+        m.setattr(config_loader, "_iter_source_entries", no_yaml)
+        assert load_sources(p) == first
+
+    _write_yaml(tmp_path, p.read_text().replace("first", "second-id"))
+    assert [s.id for s in load_sources(p)] == ["second-id"]
+
+
+def test_load_skips_cache_for_non_json_values(tmp_path):
+    p = _write_yaml(tmp_path, """
+sources:
+  - id: dated
+    domain: test
+    priority: 1
+    source_type: local
+    location: /tmp/test
+    version: 2024-01-01
+""")
+    sources = load_sources(p)
+    assert sources[0].version == date(2024, 1, 1)
+    assert not (tmp_path / "sources.yaml.cache.json").exists()
+    assert not list(tmp_path.glob("*.tmp"))
+    assert load_sources(p) == sources
@@ -0,0 +1,26 @@
+"""Tests for the Ollama embedding client (mocked HTTP transport)."""
+
+import json
+
+import httpx
+
+from cnw_ai.pipeline import embedder
+
+
+def test_embed_batch_ollama_roundtrip(monkeypatch):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append((request.url.path, request.headers["content-type"], body))
+        vectors = [[float(len(t)), 0.5] for t in body["input"]]
+        return httpx.Response(200, json={"model": body["model"], "embeddings": vectors})
+
+    client = httpx.Client(base_url="http://ollama", transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(embedder, "_get_http_client", lambda base_url: client)
+
+    vectors = embedder._embed_batch_ollama(["ab", "çay"], "nomic", "http://ollama")
+    assert vectors == [[2.0, 0.5], [3.0, 0.5]]
+    assert requests == [
+        ("/api/embed", "application/json", {"model": "nomic", "input": ["ab", "çay"]})
+    ]
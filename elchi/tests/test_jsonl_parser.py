@@ -0,0 +1,42 @@
+"""Tests for the JSONL parser."""
+
+import json
+from pathlib import Path
+
+from cnw_ai.pipeline.parsers import jsonl
+from cnw_ai.pipeline.parsers.jsonl import parse_jsonl
+
+
+def _write_jsonl(tmp_path: Path, lines: list[str]) -> Path:
+    p = tmp_path / "dataset.jsonl"
+    p.write_text("\n".join(lines) + "\n")
+    return p
+
+
+def _entry(resource: str, category: str) -> str:
+    return json.dumps({
+        "instruction": f"What is a {resource}?",
+        "output": f"A {resource} is an Envoy building block.",
+        "resource": resource,
+        "category": category,
+    })
+
+
+def test_parse_jsonl_skips_blank_and_invalid_lines(tmp_path, jsonl_source):
+    p = _write_jsonl(
+        tmp_path, [_entry("Listener", "networking"), "", "{oops", _entry("Cluster", "")]
+    )
+    docs = parse_jsonl(p, jsonl_source)
+    assert [d.uri for d in docs] == [f"{p}#0", f"{p}#3"]
+    assert docs[0].section == "networking"
+    assert docs[0].tags == ["qa", "networking"]
+    assert docs[1].tags == ["qa"]
+    assert docs[1].content.startswith("Cluster\n\nWhat is a Cluster?")
+
+
+def test_parse_jsonl_lines_spanning_read_blocks(tmp_path, jsonl_source, monkeypatch):
+    monkeypatch.setattr(jsonl, "_READ_SIZE", 7)
+    resources = [f"Filter{i}" for i in range(20)]
+    p = _write_jsonl(tmp_path, [_entry(r, "http") for r in resources])
+    docs = parse_jsonl(p, jsonl_source)
+    assert [d.title for d in docs] == resources
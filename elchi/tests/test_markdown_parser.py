@@ -0,0 +1,53 @@
+"""Tests for the markdown / RST section splitters."""
+
+from textwrap import dedent
+
+from cnw_ai.pipeline.parsers.markdown import (
+    _split_markdown_sections,
+    _split_rst_sections,
+)
+
+
+def test_markdown_sections():
+    text = dedent("""\
+        Intro before any heading.
+
+        # Install
+        Run the installer.
+
+        ## Empty
+
+        ## Configure
+        Edit the config file.
+    """)
+    assert _split_markdown_sections(text) == [
+        ("", "Intro before any heading."),
+        ("Install", "Run the installer."),
+        ("Configure", "Edit the config file."),
+    ]
+
+
+def test_markdown_without_headings():
+    assert _split_markdown_sections("  just text\n") == [("", "just text")]
+
+
+def test_rst_sections():
+    text = dedent("""\
+        Preamble text.
+
+        Install
+        =======
+        Run the installer.
+
+        Not a heading
+        =-=-=-=
+
+        Configure
+        ---------
+        Edit the config file.
+    """)
+    assert _split_rst_sections(text) == [
+        ("", "Preamble text."),
+        ("Install", "Run the installer.\n\nNot a heading\n=-=-=-="),
+        ("Configure", "Edit the config file."),
+    ]
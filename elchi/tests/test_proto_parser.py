@@ -129,3 +129,34 @@ def test_leading_comments(tmp_path):
     """)
     docs = parse_proto(p, _source())
     assert "doc comment" in docs[0].content
+
+
+def test_field_names(tmp_path):
+    p = _write_proto(tmp_path, """\
+        syntax = "proto3";
+
+        message Endpoint {
+            option deprecated = true;
+            option (custom.level) = 3;
+            option c = 3;
+            string address = 1;  // host or IP, e.g. port = 8 is invalid
+            map<string, string> labels = 2;
+            uint32 port = 3 [(validate.rules).uint32.lte = 65535];
+        }
+    """)
+    docs = parse_proto(p, _source())
+    assert docs[0].proto_field == "address, labels, port"
+
+
+def test_enum_values_are_not_fields(tmp_path):
+    p = _write_proto(tmp_path, """\
+        syntax = "proto3";
+
+        enum Mode {
+            MODE_UNSPECIFIED = 0;
+            MODE_STRICT = 1;  // when strict = 1 is set
+            MODE_LAX = 2 [(custom.alias) = 3];
+        }
+    """)
+    docs = parse_proto(p, _source())
+    assert docs[0].proto_field == ""
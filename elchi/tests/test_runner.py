@@ -0,0 +1,270 @@
+"""Tests for the pipeline runner (dry-run only, no Qdrant/Ollama)."""
+
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from cnw_ai.pipeline import runner
+from cnw_ai.pipeline.models import SourceConfig
+from cnw_ai.pipeline.runner import PipelineRunner
+
+
+def _local_source(tmp_path: Path, source_id: str) -> SourceConfig:
+    root = tmp_path / source_id
+    root.mkdir()
+    body = "Run the binary with the default configuration and check the logs. " * 4
+    (root / "guide.md").write_text(f"# Guide\n\n{body}\n\n## Usage\n\n{body}\n")
+    return SourceConfig(
+        id=source_id,
+        domain="test",
+        priority=1,
+        source_type="local",
+        location=str(root),
+        include_globs=["**/*.md"],
+    )
+
+
+def test_dry_run_processes_all_sources(tmp_path):
+    sources = [_local_source(tmp_path, "a"), _local_source(tmp_path, "b")]
+    result = PipelineRunner(sources, dry_run=True).run()
+    assert result.sources_processed == 2
+    assert result.files_fetched == 2
+    assert result.documents_parsed > 0
+    assert result.chunks_created > 0
+    assert result.errors == []
+
+
+def test_fetch_error_is_isolated_to_source(tmp_path, monkeypatch):
+    good = _local_source(tmp_path, "good")
+    bad = _local_source(tmp_path, "bad")
+    real_fetch = runner.fetch
+
+    def flaky_fetch(source, max_items=0):
+        if source.id == "bad":
+            raise RuntimeError("network down")
+        return real_fetch(source, max_items=max_items)
+
+    monkeypatch.setattr(runner, "fetch", flaky_fetch)
+    result = PipelineRunner([bad, good], dry_run=True).run()
+    assert result.sources_processed == 2
+    assert result.files_fetched == 1
+    assert result.errors == ["[bad] network down"]
+
+
+def test_prefetch_runs_one_source_ahead_and_stops_on_close(tmp_path, monkeypatch):
+    sources = [_local_source(tmp_path, sid) for sid in "abcd"]
+    fetched = []
+
+    def recording_fetch(source, max_items=0):
+        fetched.append(source.id)
+        return []
+
+    monkeypatch.setattr(runner, "fetch", recording_fetch)
+    items = PipelineRunner(sources, dry_run=True)._prefetch()
+    assert next(items)[0].id == "a"
+    time.sleep(0.1)
+    assert fetched == ["a", "b"]
+
+    items.close()
+    for thread in threading.enumerate():
+        if thread.name == "fetch":
+            thread.join(timeout=1)
+            assert not thread.is_alive()
+    assert fetched == ["a", "b"]
+
+
+class _FakeStore:
+    """Stand-in for the Qdrant/Ollama calls made by the runner."""
+
+    def __init__(self, existing: set[str] = frozenset()):
+        self.existing = set(existing)
+        self.deleted: list[str] = []
+        self.upserted: list[list[str]] = []
+
+    def install(self, monkeypatch) -> None:
+        monkeypatch.setattr(runner, "get_client", lambda: self)
+        monkeypatch.setattr(runner, "detect_embedding_dim", lambda: 4)
+        monkeypatch.setattr(runner, "ensure_collection", lambda client, dim: None)
+        monkeypatch.setattr(
+            runner,
+            "get_existing_hashes_by_source",
+            lambda client, ids: {sid: self.existing for sid in ids},
+        )
+        monkeypatch.setattr(runner, "delete_by_source", lambda client, sid: self.deleted.append(sid))
+        monkeypatch.setattr(runner, "embed_batches", self._embed)
+        monkeypatch.setattr(runner, "upsert_chunks", self._upsert)
+
+    @staticmethod
+    def _embed(chunks):
+        yield chunks, [[0.0] * 4 for _ in chunks]
+
+    def _upsert(self, client, chunks, vectors) -> int:
+        self.upserted.append([c.text_hash for c in chunks])
+        return len(chunks)
+
+
+def _multi_file_source(tmp_path: Path, n_files: int) -> SourceConfig:
+    source = _local_source(tmp_path, "multi")
+    for i in range(1, n_files):
+        body = f"File {i} explains yet another part of the configuration in detail. " * 4
+        (Path(source.location) / f"page{i}.md").write_text(f"# Page {i}\n\n{body}\n")
+    return source
+
+
+def test_ingest_streams_file_batches(tmp_path, monkeypatch):
+    store = _FakeStore()
+    store.install(monkeypatch)
+    monkeypatch.setattr(runner, "INGEST_BATCH_SIZE", 2)
+
+    result = PipelineRunner([_multi_file_source(tmp_path, 5)]).run()
+    assert result.errors == []
+    assert len(store.upserted) == 3
+    assert result.chunks_upserted == sum(map(len, store.upserted)) == result.chunks_created
+
+
+def test_ingest_dedup_and_reindex(tmp_path, monkeypatch):
+    source = _multi_file_source(tmp_path, 3)
+    first = _FakeStore()
+    first.install(monkeypatch)
+    created = PipelineRunner([source]).run().chunks_created
+    stored = {h for batch in first.upserted for h in batch}
+
+    dedup = _FakeStore(existing=stored)
+    dedup.install(monkeypatch)
+    result = PipelineRunner([source]).run()
+    assert result.chunks_skipped_dedup == created
+    assert result.chunks_upserted == 0
+    assert dedup.deleted == []
+
+    reindex = _FakeStore(existing=stored)
+    reindex.install(monkeypatch)
+    monkeypatch.setattr(runner, "INGEST_BATCH_SIZE", 1)
+    result = PipelineRunner([source], reindex=True).run()
+    assert reindex.deleted == ["multi"]
+    assert result.chunks_upserted == created
+
+
+def test_parallel_parse_matches_serial(tmp_path, monkeypatch):
+    source = _multi_file_source(tmp_path, 6)
+    serial = PipelineRunner([source], dry_run=True).run()
+
+    monkeypatch.setattr(runner, "PARALLEL_PARSE_MIN_FILES", 2)
+    monkeypatch.setattr(runner, "_PARSE_WORKERS", 2)
+    parallel = PipelineRunner([source], dry_run=True).run()
+    assert parallel == serial
+
+    # parallel=False must not start a pool at all
+    monkeypatch.setattr(runner, "ProcessPoolExecutor", None)
+    assert PipelineRunner([source], dry_run=True, parallel=False).run() == serial
+
+
+def test_parse_workers_inherit_verbosity(tmp_path, monkeypatch):
+    pools = []
+
+    class RecordingPool:
+        def __init__(self, **kwargs):
+            pools.append(kwargs)
+
+        def map(self, fn, *iterables, chunksize=1):
+            return map(fn, *iterables)
+
+        def shutdown(self, cancel_futures=False):
+            pass
+
+    monkeypatch.setattr(runner, "ProcessPoolExecutor", RecordingPool)
+    monkeypatch.setattr(runner, "PARALLEL_PARSE_MIN_FILES", 2)
+    monkeypatch.setattr(runner, "_PARSE_WORKERS", 2)
+    PipelineRunner([_multi_file_source(tmp_path, 3)], dry_run=True, verbose=True).run()
+    assert [(p["initializer"], p["initargs"]) for p in pools] == [
+        (runner.setup_logging, (True,))
+    ]
+
+
+def test_broken_parse_pool_is_replaced(tmp_path, monkeypatch):
+    pools = []
+
+    class CrashOncePool:
+        def __init__(self, **kwargs):
+            self.broken = not pools
+            pools.append(self)
+
+        def map(self, fn, *iterables, chunksize=1):
+            if self.broken:
+                raise BrokenProcessPool("worker died")
+            return map(fn, *iterables)
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            pass
+
+    monkeypatch.setattr(runner, "ProcessPoolExecutor", CrashOncePool)
+    monkeypatch.setattr(runner, "PARALLEL_PARSE_MIN_FILES", 1)
+    monkeypatch.setattr(runner, "_PARSE_WORKERS", 2)
+    sources = [_local_source(tmp_path, "a"), _local_source(tmp_path, "b")]
+    result = PipelineRunner(sources, dry_run=True).run()
+    assert result.errors == ["[a] worker died"]
+    assert len(pools) == 2
+    assert result.documents_parsed > 0
+
+
+def test_upsert_failure_is_reported(tmp_path, monkeypatch):
+    store = _FakeStore()
+    store.install(monkeypatch)
+
+    def failing_upsert(client, chunks, vectors):
+        raise RuntimeError("qdrant unavailable")
+
+    monkeypatch.setattr(runner, "upsert_chunks", failing_upsert)
+    result = PipelineRunner([_multi_file_source(tmp_path, 2)]).run()
+    assert result.errors == ["[multi] qdrant unavailable"]
+    assert result.chunks_upserted == 0
+
+
+def _slow_store(monkeypatch) -> _FakeStore:
+    """Fake store whose upserts take long enough for later batches to queue up."""
+    store = _FakeStore()
+    store.install(monkeypatch)
+    fake_upsert = store._upsert
+
+    def slow_upsert(client, chunks, vectors):
+        time.sleep(0.05)
+        return fake_upsert(client, chunks, vectors)
+
+    monkeypatch.setattr(runner, "upsert_chunks", slow_upsert)
+    return store
+
+
+def test_embed_failure_reports_only_stored_chunks(tmp_path, monkeypatch):
+    store = _slow_store(monkeypatch)
+
+    def failing_embed(chunks):
+        for chunk in chunks[:3]:
+            yield [chunk], [[0.0] * 4]
+        raise RuntimeError("ollama went away")
+
+    monkeypatch.setattr(runner, "embed_batches", failing_embed)
+    result = PipelineRunner([_multi_file_source(tmp_path, 4)]).run()
+    assert result.errors == ["[multi] ollama went away"]
+    assert result.chunks_upserted == sum(map(len, store.upserted))
+    assert result.chunks_upserted < 3  # queued batches were cancelled
+
+
+def test_upsert_failure_stops_queued_writes(tmp_path, monkeypatch):
+    store = _slow_store(monkeypatch)
+    slow_upsert = runner.upsert_chunks
+    calls = []
+
+    def first_upsert_fails(client, chunks, vectors):
+        calls.append(chunks)
+        if len(calls) == 1:
+            raise RuntimeError("qdrant unavailable")
+        return slow_upsert(client, chunks, vectors)
+
+    monkeypatch.setattr(runner, "upsert_chunks", first_upsert_fails)
+    monkeypatch.setattr(
+        runner, "embed_batches", lambda chunks: (([c], [[0.0] * 4]) for c in chunks)
+    )
+    result = PipelineRunner([_multi_file_source(tmp_path, 4)]).run()
+    assert result.errors == ["[multi] qdrant unavailable"]
+    assert result.chunks_upserted == sum(map(len, store.upserted))
+    assert len(calls) < result.chunks_created
@@ -67,6 +67,7 @@ def test_hashing():
     assert len(h) == 16
     # Normalized: whitespace insensitive
     assert text_hash("  hello   world  ") == h
+    assert text_hash("hello\u00a0\n\tWORLD") == h
 
 
 def test_config():
@@ -80,3 +81,11 @@ def test_config():
     assert "6333" in QDRANT_URL
     assert EMBEDDING_MODEL == "nomic-embed-text"
     assert CHUNK_SIZE > 0
+
+
+def test_read_text_matches_text_mode(tmp_path):
+    from cnw_ai.utils.files import read_text
+
+    p = tmp_path / "mixed.txt"
+    p.write_bytes("a\r\nb\rc\n\xe9 \xff".encode("latin-1"))
+    assert read_text(p) == p.read_text(encoding="utf-8", errors="replace")
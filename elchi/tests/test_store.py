@@ -0,0 +1,55 @@
+"""Tests for the Qdrant store helpers (local in-memory client)."""
+
+import pytest
+from qdrant_client import QdrantClient
+
+from cnw_ai.pipeline.models import ChunkDoc
+from cnw_ai.pipeline.store import (
+    delete_by_source,
+    ensure_collection,
+    get_existing_hashes,
+    get_existing_hashes_by_source,
+    upsert_chunks,
+)
+
+
+def _chunk(i: int, source_id: str) -> ChunkDoc:
+    return ChunkDoc(
+        chunk_id=f"00000000-0000-0000-0000-{i:012d}",
+        text=f"chunk {i}",
+        source_id=source_id,
+        domain="test",
+        source_type="local",
+        priority=1,
+        version="",
+        uri=f"file{i}.md",
+        title="File",
+        section="",
+        chunk_index=0,
+        tags=["test"],
+        component="",
+        text_hash=f"hash{i}",
+    )
+
+
+@pytest.fixture
+def client() -> QdrantClient:
+    client = QdrantClient(":memory:")
+    ensure_collection(client, dim=2)
+    chunks = [_chunk(i, sid) for i, sid in enumerate(["a", "a", "b", "c"])]
+    upsert_chunks(client, chunks, [[0.1, 0.2]] * len(chunks))
+    return client
+
+
+def test_existing_hashes_by_source(client):
+    assert get_existing_hashes_by_source(client, ["a", "b", "missing"]) == {
+        "a": {"hash0", "hash1"},
+        "b": {"hash2"},
+    }
+    assert get_existing_hashes(client, "c") == {"hash3"}
+
+
+def test_delete_by_source(client):
+    delete_by_source(client, "a")
+    assert get_existing_hashes(client, "a") == set()
+    assert get_existing_hashes(client, "b") == {"hash2"}